@@ -44,6 +44,9 @@ class Addr(object):
     that definitely represents a chapter and verse.
     '''
 
+    # `_string` caches the result of :meth:`__str__`.
+    __slots__ = ('first', 'second', '_string')
+
     def __init__(self, first, second=None):
         self.first = first
         try:
@@ -70,31 +73,26 @@ class Addr(object):
         return 1 if self.second is None else 2
 
     def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            return False
-        if self.first != other.first:
-            return False
-        if self.second != other.second:
-            return False
-        return True
+        return isinstance(other, self.__class__) and \
+            self.first == other.first and \
+            self.second == other.second
 
     def __ne__(self, other):
-        if not isinstance(other, self.__class__):
-            return True
-        if self.first != other.first:
-            return True
-        if self.second != other.second:
-            return True
-        return False
+        return not self.__eq__(other)
 
     def __hash__(self):
         return hash((self.first, self.second))
 
     def __str__(self):
+        try:
+            return self._string
+        except AttributeError:
+            pass
         if self.second is None:
-            return '%s' % str(self.first)
+            self._string = str(self.first)
         else:
-            return '%s:%s' % (str(self.first), str(self.second))
+            self._string = '%s:%s' % (str(self.first), str(self.second))
+        return self._string
 
     def __repr__(self):
         if self.second is None:
@@ -111,33 +109,31 @@ class AddrRange(object):
     The range is inclusive and bounded by two :class:`Addr` objects.
     '''
 
+    # `_string` caches the result of :meth:`__str__`.
+    __slots__ = ('first', 'last', '_string')
+
     def __init__(self, first, last):
         self.first = first
         self.last = last
 
     def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            return False
-        if self.first != other.first:
-            return False
-        if self.last != other.last:
-            return False
-        return True
+        return isinstance(other, self.__class__) and \
+            self.first == other.first and \
+            self.last == other.last
 
     def __ne__(self, other):
-        if not isinstance(other, self.__class__):
-            return True
-        if self.first != other.first:
-            return True
-        if self.last != other.last:
-            return True
-        return False
+        return not self.__eq__(other)
 
     def __hash__(self):
         return hash((self.first, self.last))
 
     def __str__(self):
-        return '%s-%s' % (self.first, self.last)
+        try:
+            return self._string
+        except AttributeError:
+            pass
+        self._string = '%s-%s' % (self.first, self.last)
+        return self._string
 
     def __repr__(self):
         return '<bible.AddrRange object "%s-%s" at 0x%x>' % (
@@ -167,29 +163,24 @@ class _Parser(object):
 
     def _parseCommaSeparatedSubtokens(self, token):
         self._chapterIndex = None
+        parseSubtoken = self._parseHyphenSeparatedSubtokens
         return [
-            self._parseHyphenSeparatedSubtokens(subtoken)
+            parseSubtoken(subtoken)
             for subtoken in token.split(',')
             ]
 
     def _parseHyphenSeparatedSubtokens(self, token):
-        addrs = [
-            self._parseColonSeparatedTokens(subtoken)
-            for subtoken in self._splitTokenAtHyphens(token)
-            ]
-        if len(addrs) == 1:
-            return addrs[0]
-        elif len(addrs) == 2:
-            first, second = addrs
-            return AddrRange(first, second)
+        first, hyphen, second = self._splitTokenAtHyphen(token)
+        firstAddr = self._parseColonSeparatedTokens(first)
+        if not hyphen:
+            return firstAddr
+        return AddrRange(firstAddr, self._parseColonSeparatedTokens(second))
 
     def _parseColonSeparatedTokens(self, token):
-        subtokens = self._splitTokenAtColons(token)
-        if len(subtokens) == 1:
-            return self._createAddrFromSingleToken(subtokens[0])
-        elif len(subtokens) == 2:
-            first, second = subtokens
-            return self._createAddrFromTokenPair(first, second)
+        first, colon, second = self._splitTokenAtColon(token)
+        if not colon:
+            return self._createAddrFromSingleToken(first)
+        return self._createAddrFromTokenPair(first, second)
 
     def _rejectNonString(self, token):
         if not isinstance(token, basestring):
@@ -198,31 +189,27 @@ class _Parser(object):
                     type(token), token))
 
     def _rejectEmptyString(self, token):
-        if len(token) == 0:
+        if not token:
             raise ValueError(
                 'Empty/whitespace-only string passed to addrs.parse()!')
 
-    def _splitTokenAtHyphens(self, token):
-        subtokens = token.split('-')
-        if len(subtokens) > 2:
+    def _splitTokenAtHyphen(self, token):
+        first, hyphen, second = token.partition('-')
+        if '-' in second:
             raise ValueError(
                 'Too many hyphens in token "%s"!' % token)
-        return subtokens
+        return first, hyphen, second
 
-    def _splitTokenAtColons(self, token):
-        subtokens = token.split(':')
-        if len(subtokens) > 2:
+    def _splitTokenAtColon(self, token):
+        first, colon, second = token.partition(':')
+        if ':' in second:
             raise ValueError(
                 'Too many colons in token "%s"!' % token)
-        subtokens = self._stripTrailingLettersFromTokens(subtokens)
-        return subtokens
-
-    def _stripTrailingLettersFromTokens(self, tokens):
-        # TODO: This is a temporary expedient!
-        return [
-            token.rstrip(string.lowercase)
-            for token in tokens
-            ]
+        # TODO: Stripping trailing letters is a temporary expedient!
+        return (
+            first.rstrip(string.lowercase),
+            colon,
+            second.rstrip(string.lowercase))
 
     def _createAddrFromSingleToken(self, token):
         if self._chapterIndex is not None:
@@ -22,13 +22,13 @@ Reference
 '''
 
 # Standard imports:
-import itertools
 import os
 import sys
 
 # Local imports:
 import addrs
 import citations
+import memotools
 import texts
 
 def parse(tokens):
@@ -42,33 +42,13 @@ def parse(tokens):
     whose abbreviations include 'Song'.
     '''
 
-    def generateSupertokens(tokens):
-        '''
-        Given ``['foo', 'bar', 'zod']``, generate ``'foobarzod'``,
-        ``'foobar'``, and ``'foo'``.
-        '''
-
-        for index in reversed(range(len(tokens))):
-            yield ''.join(tokens[:index + 1]), index
-
-    def parseSupertoken(token):
-        '''
-        Parse a book token in any form to a normalized form:
-
-        * Full-book name (no abbreviation)
-        * All lowercase
-        * Interior whitespace removed
-        '''
-
-        book = getBible().findBook(token)
-        if book is None:
-            return None
-        return book.normalName
-
-    for superToken, index in generateSupertokens(tokens):
-        book = parseSupertoken(superToken)
+    # Try the longest 'supertoken' first: given ``['foo', 'bar',
+    # 'zod']``, try ``'foobarzod'``, then ``'foobar'``, then ``'foo'``.
+    findBook = getBible().findBook
+    for index in reversed(range(len(tokens))):
+        book = findBook(''.join(tokens[:index + 1]))
         if book is not None:
-            return book, index + 1
+            return book.normalName, index + 1
 
     return None, 0
 
@@ -166,6 +146,14 @@ class Bible(object):
             ]
 
         self._allBooks = self._otBooks + self._ntBooks
+
+        # Index the books by every normalized name and abbreviation.
+        # (Where two books share a token, the first one wins.)
+        self._booksByToken = {}
+        for book in self._allBooks:
+            for token in book.normalTokens:
+                self._booksByToken.setdefault(token, book)
+
         self._loadText()
 
     @property
@@ -197,10 +185,7 @@ class Bible(object):
         Find and return the book that goes with `token`.
         '''
 
-        for book in self._allBooks:
-            if book.matchesToken(token):
-                return book
-        return None
+        return self._booksByToken.get(_normalizeToken(token))
 
     def findText(self, ref):
         '''
@@ -214,6 +199,21 @@ class Bible(object):
         for book in self.allBooks:
             book.text.loadFromFile()
 
+def _normalizeToken(token):
+    '''
+    Return `token` in lowercase with all whitespace removed.
+    '''
+
+    return ''.join(token.lower().split())
+
+def _internToken(token):
+    '''
+    Return `token` interned if it is a byte string.  (Python 2 cannot
+    intern ``unicode``.)
+    '''
+
+    return intern(token) if isinstance(token, str) else token
+
 class Book(object):
     '''
     A single scriptural 'book'.
@@ -222,9 +222,16 @@ class Book(object):
     def __init__(self, name, abbreviations=[], hasChapters=True):
         self.name = name
         self.abbreviations = abbreviations
+        self._normalName = _internToken(_normalizeToken(name))
+        self._normalAbbreviations = [
+            _internToken(_normalizeToken(abbreviation))
+            for abbreviation in abbreviations
+            ]
         self._hasChapters = hasChapters
         self._text = texts.Text(self.normalName, self.hasChapters)
         self._concordance = None
+        self._normalTokens = frozenset(
+            [self._normalName] + self._normalAbbreviations)
 
     @property
     def normalName(self):
@@ -236,7 +243,7 @@ class Book(object):
         * No interior whitespace
         '''
 
-        return ''.join(self.name.lower().split())
+        return self._normalName
 
     @property
     def normalAbbreviations(self):
@@ -246,18 +253,25 @@ class Book(object):
         (Same rules as for ``normalName``.
         '''
 
-        return [
-            ''.join(abbreviation.lower().split())
-            for abbreviation in self.abbreviations
-            ]
+        return list(self._normalAbbreviations)
+
+    @property
+    def normalTokens(self):
+        '''
+        The normalized name and abbreviations of the book, together in
+        a ``frozenset``.
+        '''
+
+        return self._normalTokens
 
     def matchesToken(self, token):
         '''
         Return ``True`` if `token` can refer to this book.
         '''
 
-        token = ''.join(token.lower().split())
-        return token in [self.normalName] + self.normalAbbreviations
+        # A token that is already normalized needs no new string.
+        return token in self._normalTokens or \
+            _normalizeToken(token) in self._normalTokens
 
     @property
     def hasChapters(self):
@@ -311,6 +325,17 @@ class InvalidCitation(Exception):
     def __str__(self):
         return '%s\nCause: %s' % (self.citation, self.cause)
 
+def _normalizeQuery(query):
+    '''
+    Return `query` with its whitespace normalized, or ``None`` if it is
+    not a string.
+    '''
+
+    if not isinstance(query, basestring):
+        return None
+    return ' '.join(query.split())
+
+@memotools.memoize(2048, keyOf=_normalizeQuery)
 def getVerses(query):
     '''
     Return an object representation of the verses associated with
@@ -318,27 +343,27 @@ def getVerses(query):
 
     The `query` is parsed by :func:`citations.parse`.
 
-    The representation of the returned verses is a ``list`` of pairs.
+    The representation of the returned verses is a ``tuple`` of pairs.
     The first element in each pair is the **address** of a verse.  The
     second element in each pair is the **text** of the same verse.
 
     The address of the verse is itself a pair of integers representing
     the **chapter** and **verse** respectively.  (This will have to
     change to handle the insertions into Esther.)
+
+    Results are remembered by query (see :func:`memotools.memoize`).
     '''
 
     citation = citations.parse(query)
     book = getBible().findBook(citation.book)
     if citation.addrs is None:
         # This is the citation of an entire book.
-        return book.text.getAllVerses()
+        return tuple(book.text.getAllVerses())
 
     try:
-        return list(
-            itertools.chain.from_iterable(
-                book.text.getRangeOfVerses(addrRange)
-                for addrRange in citation.addrRanges
-                )
-            )
+        verses = []
+        for addrRange in citation.addrRanges:
+            verses.extend(book.text.getRangeOfVerses(addrRange))
+        return tuple(verses)
     except KeyError as e:
         raise InvalidCitation(citation, e), None, sys.exc_info()[2]
@@ -19,6 +19,7 @@ Summary of Library Interface
 ======================================================================
 
 * :func:`formatVersesForConsole` - Format verses for display on the console
+* :func:`writeVersesForConsole` - Write verses formatted for the console
 * :func:`exportBibleAsHTML` - Export the whole Bible as HTML
 * :class:`FormattingError` - Something went wrong with formatting
 
@@ -31,12 +32,18 @@ import argparse
 import os
 import re
 import sys
-import textwrap
 
 # Local imports:
 import bible
 import viewtools
 
+# Matches a segment of verse text (less its surrounding whitespace)
+# and the formatting metacharacter that terminates it.
+_verseSegmentRegex = re.compile(r'\s*([^\[\]/\\]*?)\s*([\[\]/\\])')
+
+# The buffer size for the HTML files written by the exporters.
+_outputBufferSize = 1 << 20
+
 def main(args=None):
     '''
     This is the entry point to the command-line interface.
@@ -46,7 +53,7 @@ def main(args=None):
 
     if len(args.citations) > 0:
         verses = bible.getVerses(' '.join(args.citations))
-        sys.stdout.write(formatVersesForConsole(verses))
+        writeVersesForConsole(verses, sys.stdout)
     elif args.exportFolderPath is not None:
         exportBibleAsHTML(args.exportFolderPath)
 
@@ -109,6 +116,16 @@ def formatVersesForConsole(verses):
     verseFormatter.formatVerses(verses)
     return verseFormatter.consoleFormattedText
 
+def writeVersesForConsole(verses, outputFile=sys.stdout):
+    '''
+    Write a list of `verses` to `outputFile` formatted as by
+    :func:`formatVersesForConsole`, one paragraph at a time.
+    '''
+
+    verseFormatter = _VerseFormatter()
+    verseFormatter.formatVerses(verses)
+    verseFormatter.writeConsoleFormattedText(outputFile)
+
 class _VerseFormatter(object):
     '''
     Converts a list of `verses` to a formatted string that is readable
@@ -122,6 +139,7 @@ class _VerseFormatter(object):
         self._useColor = True
         self.paragraphs = []
         self.verseAddr = None
+        self._currentFormatting = None
 
     @property
     def useColor(self):
@@ -141,8 +159,7 @@ class _VerseFormatter(object):
         ``True`` if the current paragraph is formatted as prose.
         '''
 
-        return len(self.paragraphs) > 0 and \
-            self.paragraphs[-1].formatting == 'prose'
+        return self._currentFormatting == 'prose'
 
     @property
     def currentParagraphIsNotProse(self):
@@ -150,8 +167,8 @@ class _VerseFormatter(object):
         ``True`` if the current paragraph is formatted as prose.
         '''
 
-        return len(self.paragraphs) > 0 and \
-            self.paragraphs[-1].formatting != 'prose'
+        return self._currentFormatting is not None and \
+            self._currentFormatting != 'prose'
 
     @property
     def currentParagraphIsPoetry(self):
@@ -159,8 +176,7 @@ class _VerseFormatter(object):
         ``True`` if the current paragraph is formatted as poetry.
         '''
 
-        return len(self.paragraphs) > 0 and \
-            self.paragraphs[-1].formatting == 'poetry'
+        return self._currentFormatting == 'poetry'
 
     @property
     def currentParagraphIsNotPoetry(self):
@@ -168,8 +184,27 @@ class _VerseFormatter(object):
         ``True`` if the current paragraph is formatted as poetry.
         '''
 
-        return len(self.paragraphs) > 0 and \
-            self.paragraphs[-1].formatting != 'poetry'
+        return self._currentFormatting is not None and \
+            self._currentFormatting != 'poetry'
+
+    def _appendParagraph(self, formatting):
+        '''
+        Start a new paragraph with `formatting` and make it current.
+        '''
+
+        self.paragraphs.append(_Paragraph(formatting, self.useColor))
+        self._currentFormatting = formatting
+
+    def _popParagraph(self):
+        '''
+        Discard the current paragraph.
+        '''
+
+        self.paragraphs.pop()
+        if len(self.paragraphs) > 0:
+            self._currentFormatting = self.paragraphs[-1].formatting
+        else:
+            self._currentFormatting = None
 
     def addTextToCurrentParagraph(self, text):
         '''
@@ -185,16 +220,26 @@ class _VerseFormatter(object):
 
         if len(text) > 0:
             if len(self.paragraphs) == 0:
-                self.paragraphs.append(_Paragraph('prose', self.useColor))
+                self._appendParagraph('prose')
             self.paragraphs[-1].addText(self.verseAddr, text)
             self.verseAddr = None
 
+    def reset(self):
+        '''
+        Forget any verses formatted so far, so that this formatter can
+        be reused for other verses.
+        '''
+
+        self.paragraphs = []
+        self.verseAddr = None
+        self._currentFormatting = None
+
     def formatVerses(self, verses):
         '''
         Return the `verses` as a formatted, ready-to-display string.
         '''
 
-        self.paragraphs = []
+        self.reset()
 
         # Allocate the verses to paragraphs.
         for verseAddr, verseText in verses:
@@ -204,7 +249,7 @@ class _VerseFormatter(object):
         # Trim the trailing empty paragraph (if there is one).
         if len(self.paragraphs) > 0:
             if self.paragraphs[-1].isEmpty:
-                self.paragraphs.pop()
+                self._popParagraph()
 
     @property
     def consoleFormattedText(self):
@@ -213,6 +258,18 @@ class _VerseFormatter(object):
                 for index, paragraph in enumerate(self.paragraphs)
                 ]) + '\n'
 
+    def writeConsoleFormattedText(self, outputFile):
+        '''
+        Write the same text as `consoleFormattedText` to `outputFile`
+        without first joining the paragraphs into one string.
+        '''
+
+        for index, paragraph in enumerate(self.paragraphs):
+            if index != 0:
+                outputFile.write('\n')
+            outputFile.write(paragraph.formatForConsole(index == 0))
+        outputFile.write('\n')
+
     @property
     def htmlFormattedText(self):
         return '\n'.join([
@@ -227,39 +284,19 @@ class _VerseFormatter(object):
         in the `verseText`.
         '''
 
-        metaCharRegex = r'[\[\]/\\]'
-
-        matchResult = re.search(metaCharRegex, verseText)
-        while matchResult is not None:
-            # Capture everything up to the metacharacter in
-            # `verseTextSegment`.
-            verseTextSegment = verseText[:matchResult.start()].strip()
-
-            metaChar = verseText[matchResult.start()]
-            if metaChar == '[':
-                self._handlePoetryBegin(verseTextSegment)
-            elif metaChar == ']':
-                self._handlePoetryEnd(verseTextSegment)
-            elif metaChar == '/':
-                self._handlePoetryLineBreak(verseTextSegment)
-            elif metaChar == '\\':
-                self._handleParagraphBreak(verseTextSegment)
-
-            # Discard the portion of `verseText` up to and including
-            # the metacharacter (the part we just handled) and attempt
-            # to match again.
-            verseText = verseText[matchResult.start() + 1:].strip()
-            matchResult = re.search(metaCharRegex, verseText)
+        segments, remainingText = _splitVerseText(verseText)
+        for verseTextSegment, metaChar in segments:
+            self._metaCharHandlers[metaChar](self, verseTextSegment)
 
         # Everything that remains of the current `verseText` should be
         # committed to the current paragraph.
-        self.addTextToCurrentParagraph(verseText)
+        self.addTextToCurrentParagraph(remainingText)
 
     def _handlePoetryBegin(self, verseTextSegment):
         # This is a request to commit the current `verseTextSegment`
         # to the current paragraph and start a new paragraph with
         # poetry formatting.
-        if self.currentParagraphIsPoetry:
+        if self._currentFormatting == 'poetry':
             pass
             # TODO: Investigate this!
             # raise FormattingError(
@@ -275,15 +312,15 @@ class _VerseFormatter(object):
         if len(self.paragraphs) > 0:
             # TODO: Investigate this!
             if self.paragraphs[-1].isEmpty:
-                self.paragraphs.pop()
+                self._popParagraph()
 
-        self.paragraphs.append(_Paragraph('poetry', self.useColor))
+        self._appendParagraph('poetry')
 
     def _handlePoetryEnd(self, verseTextSegment):
         # This is a request to commit the current `verseTextSegment`
         # to the current paragraph, to start a new paragraph, and to
         # exit poetry formatting.
-        if self.currentParagraphIsProse:
+        if self._currentFormatting == 'prose':
             pass
             # TODO: Investigate this!
             # raise FormattingError(
@@ -291,18 +328,18 @@ class _VerseFormatter(object):
 
         self.addTextToCurrentParagraph(verseTextSegment)
 
-        self.paragraphs.append(_Paragraph('prose', self.useColor))
+        self._appendParagraph('prose')
 
     def _handlePoetryLineBreak(self, verseTextSegment):
         # Assuming poetry formatting, this means a line break.  Add
         # the `verseTextSegment` to the current paragraph.
-        if self.currentParagraphIsNotPoetry:
+        if self._currentFormatting not in (None, 'poetry'):
             # The first reading for all-souls-1 (Jb 19:1,23-27) has
             # precisely this thing, so it must be legit.
             #
             # raise FormattingError(
             #     'Saw "/" outside of poetry!')
-            self.paragraphs.append(_Paragraph('poetry', self.useColor))
+            self._appendParagraph('poetry')
 
         self.addTextToCurrentParagraph(verseTextSegment)
 
@@ -310,7 +347,7 @@ class _VerseFormatter(object):
         # Assuming prose formatting, this means a paragraph break.
         # Commit the current `verseTextSegment` to the current
         # paragraph and start a new paragraph.
-        if self.currentParagraphIsNotProse:
+        if self._currentFormatting not in (None, 'prose'):
             # This appear in Obadiah, verse 16, so it must be legit.
             #
             # raise FormattingError(
@@ -324,7 +361,15 @@ class _VerseFormatter(object):
         # poetry AND a paragraph with ']\'.  We don't two empty
         # paragraphs on the end.  One is enough.
         if not self.paragraphs[-1].isEmpty:
-            self.paragraphs.append(_Paragraph('prose', self.useColor))
+            self._appendParagraph('prose')
+
+    # The metacharacter handling functions, by metacharacter.
+    _metaCharHandlers = {
+        '[': _handlePoetryBegin,
+        ']': _handlePoetryEnd,
+        '/': _handlePoetryLineBreak,
+        '\\': _handleParagraphBreak,
+        }
 
 def exportBibleAsHTML(outputFolderPath):
     '''
@@ -384,19 +429,8 @@ class _HTMLBibleExporter(object):
 
 class _HTMLBibleIndexExporter(object):
 
-    def __init__(self, outputFolderPath):
-        self.outputFolderPath = outputFolderPath
-
-    def export(self):
-        outputFilePath = os.path.join(self.outputFolderPath, 'index.html')
-
-        with open(outputFilePath, 'w') as outputFile:
-            self._writeIndexHead(outputFile)
-            self._writeIndexBody(outputFile)
-            self._writeIndexFoot(outputFile)
-
-    def _writeIndexHead(self, outputFile):
-        outputFile.write('''\
+    # The whole index page, less the indexes of the two testaments.
+    INDEX_TEMPLATE = '''\
 <!DOCTYPE html>
 <html>
   <head>
@@ -409,60 +443,62 @@ class _HTMLBibleIndexExporter(object):
   </head>
   <body>
     <h1>The Sacred Scriptures (Clementine Vulgate Text)</h1>
-''')
-
-    def _writeIndexBody(self, outputFile):
-        self._writeIndexOfTestament(
-            outputFile, bible.getBible().otBooks, 'Vetus Testamentum')
-        self._writeIndexOfTestament(
-            outputFile, bible.getBible().ntBooks, 'Novum Testamentum')
-
-    def _writeIndexOfTestament(self, outputFile, books, title):
-        outputFile.write('''\
-    <h2>%s</h2>
-''' % title)
+%(otIndex)s%(ntIndex)s    <hr/>
+    <a href="../index.html">fideidepositum.org</a>
+  </body>
+</html>
+'''
 
-        outputFile.write('''\
+    # The index of one testament, less its columns of books.
+    TESTAMENT_TEMPLATE = '''\
+    <h2>%(title)s</h2>
     <table>
       <tr>
-''')
-
-        for columnOfBooks in viewtools.columnizedList(books, 2):
-            self._writeColumnOfIndexEntries(outputFile, columnOfBooks)
-
-        outputFile.write('''\
-      </tr>
+%(columns)s      </tr>
     </table>
-''')
+'''
 
-    def _writeColumnOfIndexEntries(self, outputFile, books):
-        outputFile.write('''\
+    # One column of books in the index of a testament.
+    COLUMN_TEMPLATE = '''\
         <td class="index-table-data">
           <ul>
-''')
-        for book in books:
-            self._writeIndexOfBook(outputFile, book)
-        outputFile.write('''\
-          </ul>
+%(entries)s          </ul>
         </td>
-''')
-
-    def _writeIndexOfBook(self, outputFile, book):
-        outputFile.write('''\
-            <li>''')
+'''
 
-        outputFile.write(
-            '<a href="%s.html">%s</a>' % (book.normalName, book.name))
+    def __init__(self, outputFolderPath):
+        self.outputFolderPath = outputFolderPath
 
-        outputFile.write('</li>\n')
+    def export(self):
+        outputFilePath = os.path.join(self.outputFolderPath, 'index.html')
 
-    def _writeIndexFoot(self, outputFile):
-        outputFile.write('''\
-    <hr/>
-    <a href="../index.html">fideidepositum.org</a>
-  </body>
-</html>
-''')
+        indexText = self.INDEX_TEMPLATE % {
+            'otIndex': self._formatIndexOfTestament(
+                bible.getBible().otBooks, 'Vetus Testamentum'),
+            'ntIndex': self._formatIndexOfTestament(
+                bible.getBible().ntBooks, 'Novum Testamentum'),
+            }
+
+        with open(outputFilePath, 'w', _outputBufferSize) as outputFile:
+            outputFile.write(indexText)
+
+    def _formatIndexOfTestament(self, books, title):
+        return self.TESTAMENT_TEMPLATE % {
+            'title': title,
+            'columns': ''.join([
+                    self._formatColumnOfIndexEntries(columnOfBooks)
+                    for columnOfBooks in viewtools.columnizedList(books, 2)
+                    ]),
+            }
+
+    def _formatColumnOfIndexEntries(self, books):
+        return self.COLUMN_TEMPLATE % {
+            'entries': ''.join([
+                    '            <li><a href="%s.html">%s</a></li>\n' % (
+                        book.normalName, book.name)
+                    for book in books
+                    ]),
+            }
 
 class _HTMLBibleBookExporter(object):
 
@@ -480,13 +516,18 @@ class _HTMLBibleBookExporter(object):
         outputFilePath = os.path.join(
             self.outputFolderPath, '%s.html' % book.normalName)
 
-        with open(outputFilePath, 'w') as outputFile:
-            self._writeBookHead(outputFile, book)
-            self._writeBookBody(outputFile, book)
-            self._writeBookFoot(outputFile, book)
+        # Collect the whole book and write it out at once.
+        outputParts = []
+        self._writeBookHead(outputParts, book)
+        self._writeBookBody(
+            outputParts, book, book.text.getAllVersesByChapter())
+        self._writeBookFoot(outputParts, book)
 
-    def _writeBookHead(self, outputFile, book):
-        outputFile.write('''\
+        with open(outputFilePath, 'w', _outputBufferSize) as outputFile:
+            outputFile.write(''.join(outputParts))
+
+    def _writeBookHead(self, outputParts, book):
+        outputParts.append('''\
 <!DOCTYPE html>
 <html>
   <head>
@@ -500,43 +541,42 @@ class _HTMLBibleBookExporter(object):
   <body>
 ''' % book.name)
 
-        outputFile.write('''\
+        outputParts.append('''\
     <h1>%s</h1>
     <a href="index.html">Index</a>
 ''' % book.name)
 
         if book.hasChapters:
-            outputFile.write('''\
+            outputParts.append('''\
     |
 ''')
             chapterNumbers = [
                 '<a href="#chapter-%s">%s</a>' % (chapterKey, chapterKey)
                 for chapterKey in book.text.chapterKeys
                 ]
-            outputFile.write('''\
+            outputParts.append('''\
     %s
 ''' % ' | '.join(chapterNumbers))
 
-        outputFile.write('''\
+        outputParts.append('''\
     | <a href="%s-concordance.html">Concordance</a>
 ''' % book.normalName)
 
-        outputFile.write('''\
+        outputParts.append('''\
 ''')
 
-    def _writeBookBody(self, outputFile, book):
-        for chapterKey in book.text._text.keys():
+    def _writeBookBody(self, outputParts, book, chapters):
+        for chapterKey, verses in chapters:
             if book.hasChapters:
-                outputFile.write('''\
+                outputParts.append('''\
     <h2><a name="chapter-%d">%d</a></h2>
 ''' % (chapterKey, chapterKey))
 
-            verses = book.text._allVersesInChapter(chapterKey)
             self.formatter.formatVerses(verses)
-            outputFile.write(self.formatter.htmlFormattedText)
+            outputParts.append(self.formatter.htmlFormattedText)
 
-    def _writeBookFoot(self, outputFile, book):
-        outputFile.write('''\
+    def _writeBookFoot(self, outputParts, book):
+        outputParts.append('''\
     <hr/>
     <a href="../index.html">fideidepositum.org</a>
   </body>
@@ -547,13 +587,17 @@ class _HTMLBibleBookExporter(object):
         outputFilePath = os.path.join(
             self.outputFolderPath, '%s-concordance.html' % book.normalName)
 
-        with open(outputFilePath, 'w') as outputFile:
-            self._writeConcordanceHead(outputFile, book)
-            self._writeConcordanceBody(outputFile, book)
-            self._writeConcordanceFoot(outputFile, book)
+        # Collect the whole concordance and write it out at once.
+        outputParts = []
+        self._writeConcordanceHead(outputParts, book)
+        self._writeConcordanceBody(outputParts, book)
+        self._writeConcordanceFoot(outputParts, book)
 
-    def _writeConcordanceHead(self, outputFile, book):
-        outputFile.write('''\
+        with open(outputFilePath, 'w', _outputBufferSize) as outputFile:
+            outputFile.write(''.join(outputParts))
+
+    def _writeConcordanceHead(self, outputParts, book):
+        outputParts.append('''\
 <!DOCTYPE html>
 <html>
   <head>
@@ -567,41 +611,41 @@ class _HTMLBibleBookExporter(object):
   <body>
 ''' % book.name)
 
-        outputFile.write('''\
+        outputParts.append('''\
     <h1>Concordance of %s</h1>
 ''' % book.name)
 
-        outputFile.write('''\
+        outputParts.append('''\
     <a href="index.html">Index</a>
 ''')
 
-        outputFile.write('''\
+        outputParts.append('''\
     | <a href="%s.html">Text</a>
 ''' % book.normalName)
 
-        outputFile.write('''\
+        outputParts.append('''\
     | %s
 ''' % ' | '.join([
                     '<a href="#%s">%s</a>' % (letter, letter)
                     for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
                     ]))
 
-    def _writeConcordanceBody(self, outputFile, book):
+    def _writeConcordanceBody(self, outputParts, book):
         for letter in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
-            outputFile.write('''\
+            outputParts.append('''\
     <a name="%s"><h2>%s</h2></a>
 ''' % (letter, letter))
             entries = book.concordance.getEntriesForInitial(letter.lower())
-            outputFile.write('''\
+            outputParts.append('''\
       <ul>
 ''')
             for entry in entries:
-                self._writeConcordanceEntry(outputFile, book, entry)
-            outputFile.write('''\
+                self._writeConcordanceEntry(outputParts, book, entry)
+            outputParts.append('''\
       </ul>
 ''')
 
-    def _writeConcordanceEntry(self, outputFile, book, entry):
+    def _writeConcordanceEntry(self, outputParts, book, entry):
         def formatAddr(addr):
             addrToken = '%s:%s' % (addr[0], addr[1])
 
@@ -621,15 +665,15 @@ class _HTMLBibleBookExporter(object):
 <a target="_blank" href="http://en.wiktionary.org/wiki/%s#Latin">Wiktionary</a>''' % (
                 word)
 
-        outputFile.write('''\
+        outputParts.append('''\
 <li>%s - %s - %s</li>
 ''' % (
                 entry.word,
                 formatAddrList(entry.addrs),
                 formatDictionaryLink(entry.word)))
 
-    def _writeConcordanceFoot(self, outputFile, book):
-        outputFile.write('''\
+    def _writeConcordanceFoot(self, outputParts, book):
+        outputParts.append('''\
     <hr/>
     <a href="../index.html">fideidepositum.org</a>
   </body>
@@ -642,13 +686,13 @@ class _Paragraph(object):
     format it for either the console or the browser.
     '''
 
-    # A wrapper for the leading paragraph of prose.
-    textWrapperForProse1 = textwrap.TextWrapper(
-        width=80)
+    __slots__ = ('formatting', 'useColor', 'lines', '_consoleFormatter')
 
-    # A wrapper for second and following paragraphs of prose.
-    textWrapperForProse2 = textwrap.TextWrapper(
-        width=80, initial_indent='    ')
+    # The width to which prose is wrapped for the console.
+    PROSE_WIDTH = 80
+
+    # The indentation for second and following paragraphs of prose.
+    PROSE_INDENT = '    '
 
     # The ANSI sequence for 'dim' text.
     DIM = '\033[2m'
@@ -656,11 +700,21 @@ class _Paragraph(object):
     # The ANSI sequence for 'normal brightness' text.
     NORMAL = '\033[22m'
 
+    # The formats for a line of prose with an address, with and
+    # without color.
+    COLOR_PROSE_LINE_FORMAT = DIM + '%d:%d' + NORMAL + ' %s'
+    PLAIN_PROSE_LINE_FORMAT = '[%d:%d] %s'
+
     def __init__(self, formatting, useColor=True):
         self.formatting = formatting
         self.useColor = useColor
         self.lines = []
 
+        # Settle on the console formatting function just once.  (The
+        # plain function is kept, not a bound method, which would make
+        # each paragraph refer to itself.)
+        self._consoleFormatter = self._consoleFormatters.get(formatting)
+
     def addText(self, addr, text):
         self.lines.append((addr, text))
 
@@ -669,59 +723,63 @@ class _Paragraph(object):
         return len(self.lines) == 0
 
     def formatForConsole(self, isFirst=True):
-        if self.formatting == 'prose':
-            return self._formatProseForConsole(isFirst)
-        elif self.formatting == 'poetry':
-            return self._formatPoetryForConsole()
+        if self._consoleFormatter is not None:
+            return self._consoleFormatter(self, isFirst)
 
     def _formatProseForConsole(self, isFirst):
 
+        # Settle the address format once for the whole paragraph.
+        if self.useColor:
+            lineFormat = self.COLOR_PROSE_LINE_FORMAT
+        else:
+            lineFormat = self.PLAIN_PROSE_LINE_FORMAT
+
         def formatLineOfProse(addr, text):
             if addr is None:
-                addrToken = ''
-            else:
-                chapter, verse = addr
-                if self.useColor:
-                    addrToken = '%s%d:%d%s' % (
-                        self.DIM, chapter, verse, self.NORMAL)
-                else:
-                    addrToken = '[%d:%d]' % (chapter, verse)
-            return '%s %s' % (addrToken, text)
+                return ' ' + text
+            chapter, verse = addr
+            return lineFormat % (chapter, verse, text)
 
-        if isFirst:
-            textWrapper = self.textWrapperForProse1
+        return _wrapGreedily(
+            ' '.join(
+                formatLineOfProse(addr, text)
+                for addr, text in self.lines
+                ),
+            self.PROSE_WIDTH,
+            '' if isFirst else self.PROSE_INDENT)
+
+    def _formatPoetryForConsole(self, isFirst=True):
+        # `isFirst` only matters for prose; every paragraph of poetry
+        # is indented alike.
+
+        # Either way, the address takes two more columns than its
+        # digits: brackets when plain, or two spaces after the (zero
+        # width) ANSI sequences when in color.
+        if self.useColor:
+            lineFormat = self.DIM + '%s' + self.NORMAL + '  %s%s'
         else:
-            textWrapper = self.textWrapperForProse2
-
-        return textWrapper.fill(
-            ' '.join([
-                    formatLineOfProse(addr, text)
-                    for addr, text in self.lines
-                    ]))
-
-    def _formatPoetryForConsole(self):
+            lineFormat = '[%s]%s%s'
 
         def formatLineOfPoetry(addr, text, isFirst):
-            if addr is None:
-                addrToken = ''
-            else:
-                chapter, verse = addr
-                addrToken = '[%d:%d]' % (chapter, verse)
-
             indentSize = (12 if isFirst else 16)
-            addrToken = '%-*s' % (indentSize, addrToken)
-
-            if self.useColor:
-                addrToken = addrToken.replace('[', self.DIM)
-                addrToken = addrToken.replace(']', self.NORMAL + '  ')
+            if addr is None:
+                return ' ' * indentSize + text
 
-            return '%s%s' % (addrToken, text)
+            addrText = '%d:%d' % addr
+            padding = ' ' * (indentSize - len(addrText) - 2)
+            return lineFormat % (addrText, padding, text)
 
         return '\n'.join([
                 formatLineOfPoetry(addr, text, index == 0)
                 for index, (addr, text) in enumerate(self.lines)
                 ])
 
+    # The console formatting functions, by paragraph formatting.
+    _consoleFormatters = {
+        'prose': _formatProseForConsole,
+        'poetry': _formatPoetryForConsole,
+        }
+
     def formatForBrowser(self, isFirst=True):
         if self.formatting == 'prose':
             return self._formatProseForBrowser(isFirst)
@@ -769,6 +827,61 @@ class _Paragraph(object):
         htmlLines.append('</p>\n')
         return '\n'.join(htmlLines)
 
+def _splitVerseText(verseText):
+    '''
+    Split `verseText` at its formatting metacharacters and return a
+    pair: a tuple of ``(segment, metaChar)`` pairs, one per
+    metacharacter, and the text remaining after the last one.
+    '''
+
+    # Most verses have no metacharacters at all.  Skip the regex for
+    # those.
+    if '[' not in verseText and ']' not in verseText \
+            and '/' not in verseText and '\\' not in verseText:
+        return (), verseText
+
+    # Walk the metacharacters with a cursor rather than re-slicing
+    # `verseText` after each one.  The regex hands back each segment
+    # already stripped of surrounding whitespace.
+    segments = []
+    position = 0
+    for matchResult in _verseSegmentRegex.finditer(verseText):
+        segments.append(matchResult.groups())
+        position = matchResult.end()
+
+    # (There is at least one metacharacter, so `position` is past it.)
+    return tuple(segments), verseText[position:].strip()
+
+def _wrapGreedily(text, width, initialIndent=''):
+    '''
+    Wrap `text` to lines no longer than `width` (where possible) and
+    return them joined by newlines, with `initialIndent` leading the
+    first line.
+
+    This walks the words of `text` just once.  Unlike
+    ``textwrap.TextWrapper``, it never breaks on hyphens or splits long
+    words; a word longer than `width` gets a line of its own.
+    '''
+
+    lines = []
+    words = []
+    lineLength = len(initialIndent)
+    for word in text.split():
+        if words and (lineLength + 1 + len(word) > width):
+            lines.append(' '.join(words))
+            words = []
+            lineLength = 0
+        if words:
+            lineLength += 1
+        lineLength += len(word)
+        words.append(word)
+    if words:
+        lines.append(' '.join(words))
+
+    if len(lines) == 0:
+        return ''
+    return initialIndent + '\n'.join(lines)
+
 class FormattingError(RuntimeError):
     '''
     An error that occurred during formatting
@@ -19,6 +19,7 @@ import sys
 # Local imports:
 import bible
 import addrs
+import memotools
 
 class Citation(object):
     '''
@@ -77,17 +78,13 @@ class Citation(object):
         '''
 
         # Perhaps this logic belongs in the constructor.
-        def normalize(loc):
-            if isinstance(loc, addrs.AddrRange):
-                return loc
-            else:
-                return addrs.AddrRange(loc, loc)
-
+        AddrRange = addrs.AddrRange
         return [
-            normalize(loc)
+            loc if isinstance(loc, AddrRange) else AddrRange(loc, loc)
             for loc in self.addrs
             ]
 
+@memotools.memoize(4096)
 def parse(query):
     '''
     Parse a human-readable citation (`query`) to its object
@@ -99,6 +96,7 @@ def parse(query):
 
     The `query` must be confined to a single book.
 
+    Results are remembered by query (see :func:`memotools.memoize`).
     '''
 
     try:
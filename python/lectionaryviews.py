@@ -148,9 +148,13 @@ def writeReadingsAsText(massTitle, readings, options, outputFile=sys.stdout):
     outputFile.write('Readings for %s\n' % (massTitle))
     outputFile.write('%s\n' % ('=' * 80))
 
+    # One formatter serves every reading; it resets itself for each.
+    verseFormatter = bibleviews._VerseFormatter()
     for reading, verses in readings.iteritems():
         outputFile.write('\n%s\n' % reading.title)
-        outputFile.write('\n%s' % bibleviews.formatVersesForConsole(verses))
+        outputFile.write('\n')
+        verseFormatter.formatVerses(verses)
+        verseFormatter.writeConsoleFormattedText(outputFile)
 
 def exportLectionaryAsHTML(outputFolderPath):
     '''
@@ -0,0 +1,58 @@
+'''
+Things useful in remembering results
+
+The same queries come up again and again (in the lectionary, for
+example), so the results of parsing and looking them up are worth
+remembering.  Python 2 has no ``functools.lru_cache``, hence
+:func:`memoize`.
+
+Reference
+======================================================================
+'''
+
+# Standard imports:
+import functools
+
+def memoize(maxSize, keyOf=None):
+    '''
+    Return a decorator that makes a function of one argument remember
+    its results, starting afresh once it remembers `maxSize` of them.
+
+    Remembered results are shared between callers, so treat them as
+    read-only.  Exceptions are never remembered.
+
+    `keyOf` maps an argument to the key under which its result is
+    remembered, or to ``None`` to leave that result unremembered.  By
+    default, a string argument is its own key and any other argument
+    goes unremembered.
+    '''
+
+    if keyOf is None:
+        keyOf = _stringKeyOf
+
+    def decorate(function):
+        results = {}
+
+        @functools.wraps(function)
+        def memoized(argument):
+            key = keyOf(argument)
+            if key is None:
+                return function(argument)
+
+            try:
+                return results[key]
+            except KeyError:
+                pass
+
+            result = function(argument)
+            if len(results) >= maxSize:
+                results.clear()
+            results[key] = result
+            return result
+
+        return memoized
+
+    return decorate
+
+def _stringKeyOf(argument):
+    return argument if isinstance(argument, basestring) else None
@@ -20,6 +20,9 @@ class AddrTestCase(unittest.TestCase):
         self.assertEqual('2', str(addrs.Addr(2)))
         self.assertEqual('1:2', str(addrs.Addr(1, 2)))
 
+        addr = addrs.Addr(1, 2)
+        self.assertIs(str(addr), str(addr))
+
 class RangeTestCase(unittest.TestCase):
 
     def test_eq(self):
@@ -35,12 +38,17 @@ class RangeTestCase(unittest.TestCase):
 class parseTestCase(unittest.TestCase):
 
     def test_None(self):
-        with self.assertRaises(addrs.ParsingError):
+        with self.assertRaises(addrs.ParsingError) as context:
             addrs.parse(None)
+        self.assertIsInstance(context.exception.cause, TypeError)
 
     def test_emptyString(self):
-        with self.assertRaises(addrs.ParsingError):
+        with self.assertRaises(addrs.ParsingError) as context:
             addrs.parse('')
+        self.assertIsInstance(context.exception.cause, ValueError)
+        with self.assertRaises(addrs.ParsingError) as context:
+            addrs.parse(' \t')
+        self.assertIsInstance(context.exception.cause, ValueError)
 
     def test_syntheticAndMinimal(self):
         self.assertEqual(
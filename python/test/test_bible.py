@@ -47,22 +47,42 @@ class BibleTestCase(unittest.TestCase):
 
 class BookTestCase(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.genesis = bible.Book('Genesis', ['Gn'])
+
     def test_normalName(self):
-        self.assertEqual('genesis', bible.Book('Genesis', ['Gn']).normalName)
+        self.assertEqual('genesis', self.genesis.normalName)
 
     def test_normalAbbreviations(self):
+        self.assertEqual(['gn'], self.genesis.normalAbbreviations)
+
+        # Changing the returned list must not change the book.
+        book = bible.Book('Genesis', ['Gn'])
+        book.normalAbbreviations.append('xx')
+        self.assertEqual(['gn'], book.normalAbbreviations)
+        self.assertFalse(book.matchesToken('xx'))
+
+    def test_unicodeNames(self):
+        book = bible.Book(u'Genesis', [u'Gn'])
+        self.assertEqual(u'genesis', book.normalName)
+        self.assertEqual([u'gn'], book.normalAbbreviations)
+        self.assertTrue(book.matchesToken('GN'))
+
+    def test_normalTokens(self):
         self.assertEqual(
-            ['gn'], bible.Book('Genesis', ['Gn']).normalAbbreviations)
+            frozenset(['songofsongs', 'song', 'sg']),
+            bible.Book('Song of Songs', ['Song', 'Sg']).normalTokens)
 
     def test_matchesToken(self):
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('Genesis'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('genesis'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('GENESIS'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('GeNesIs'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('Gn'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('gn'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('GN'))
-        self.assertTrue(bible.Book('Genesis', ['Gn']).matchesToken('gN'))
+        self.assertTrue(self.genesis.matchesToken('Genesis'))
+        self.assertTrue(self.genesis.matchesToken('genesis'))
+        self.assertTrue(self.genesis.matchesToken('GENESIS'))
+        self.assertTrue(self.genesis.matchesToken('GeNesIs'))
+        self.assertTrue(self.genesis.matchesToken('Gn'))
+        self.assertTrue(self.genesis.matchesToken('gn'))
+        self.assertTrue(self.genesis.matchesToken('GN'))
+        self.assertTrue(self.genesis.matchesToken('gN'))
 
     def test_str(self):
         self.assertEqual('Genesis (Gn)', str(bible.Book('Genesis', ['Gn'])))
@@ -95,6 +115,11 @@ class getVersesTestCase(unittest.TestCase):
         verseAddr, verseText = verses[1]
         self.assertEqual((11, 26), verseAddr)
 
+    def test_repeatedQuery(self):
+        self.assertIs(
+            bible.getVerses('john 11:25-26'),
+            bible.getVerses('  john   11:25-26 '))
+
     def test_invalidRangeOfVerses(self):
         with self.assertRaises(bible.InvalidCitation):
             bible.getVerses('john 18:42')
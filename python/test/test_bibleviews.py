@@ -93,6 +93,31 @@ qui credit in eum, non pereat, sed habeat vitam æternam.
 '''
         self.assertEqual(expectedText, verseFormatter.consoleFormattedText)
 
+    def test_writeConsoleFormattedText(self):
+        '''
+        Writing the console text gives the same result as formatting
+        it, including when there is nothing to format.
+        '''
+
+        for verses in ([], [
+                ((3, 4), 'Est autem Deus verax: [Ut justificeris in sermonibus tuis:/ et vincas cum judicaris.]')
+                ]):
+            verseFormatter = bibleviews._VerseFormatter()
+            verseFormatter.useColor = False
+            verseFormatter.formatVerses(verses)
+
+            outputFile = StringIO.StringIO()
+            verseFormatter.writeConsoleFormattedText(outputFile)
+            self.assertEqual(
+                verseFormatter.consoleFormattedText, outputFile.getvalue())
+
+    def test_reset(self):
+        verseFormatter = bibleviews._VerseFormatter()
+        verseFormatter.formatVerses([((1, 1), '[Audi, Israel./')])
+        verseFormatter.reset()
+        self.assertEqual([], verseFormatter.paragraphs)
+        self.assertFalse(verseFormatter.currentParagraphIsPoetry)
+
     def test_htmlFormattedText_obadiah_1_2(self):
         '''
         Obadiah verses 1 and 2 contains a transition from prose to
@@ -155,6 +180,22 @@ qui credit in eum, non pereat, sed habeat vitam æternam.
 
         self.assertEqual(expectedText, formatter.htmlFormattedText)
 
+class splitVerseTextTestCase(unittest.TestCase):
+
+    def test_noMetaCharacters(self):
+        self.assertEqual(
+            ((), 'In principio erat Verbum,'),
+            bibleviews._splitVerseText('In principio erat Verbum,'))
+
+    def test_metaCharacters(self):
+        self.assertEqual(
+            ((('Visio Abdiae.', '['),
+              ('Haec dicit Dominus Deus ad Edom:', '/'),
+              ('', ']')),
+             'Et'),
+            bibleviews._splitVerseText(
+                'Visio Abdiae. [Haec dicit Dominus Deus ad Edom:/ ] Et '))
+
 class HTMLBibleExporterTestCase(unittest.TestCase):
 
     pass
@@ -169,7 +210,36 @@ class HTMLBibleBookExporterTestCase(unittest.TestCase):
 
 class ParagraphTestCase(unittest.TestCase):
 
-    pass
+    def test_formatProseForConsole(self):
+        '''
+        Second and following paragraphs of prose are indented, and
+        words are neither broken at hyphens nor split when long.
+        '''
+
+        paragraph = bibleviews._Paragraph('prose', useColor=False)
+        paragraph.addText((1, 1), 'Verbum ' + 'x' * 80 + ' semi-plenum.')
+        paragraph.addText(None, 'Et  lux in tenebris lucet.')
+
+        expectedText = '''\
+    [1:1] Verbum
+xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx
+semi-plenum. Et lux in tenebris lucet.'''
+        self.assertEqual(expectedText, paragraph.formatForConsole(False))
+
+    def test_formatProseForConsole_hyphenAtEndOfLine(self):
+        '''
+        A hyphenated word that crosses the 80th column moves whole to
+        the next line.
+        '''
+
+        paragraph = bibleviews._Paragraph('prose', useColor=False)
+        paragraph.addText(
+            (2, 1), 'Haec ' * 14 + 'sunt verba-verba-verba finis.')
+
+        expectedText = '''\
+[2:1] Haec Haec Haec Haec Haec Haec Haec Haec Haec Haec Haec Haec Haec Haec sunt
+verba-verba-verba finis.'''
+        self.assertEqual(expectedText, paragraph.formatForConsole(True))
 
 class FormattingErrorTestCase(unittest.TestCase):
 
@@ -38,6 +38,15 @@ class parseTestCase(unittest.TestCase):
         with self.assertRaises(citations.ParsingError):
             citations.parse('Is 49L1-6')
 
+    def test_repeatedQuery(self):
+        self.assertIs(
+            citations.parse('1 samuel 1:2-3:4'),
+            citations.parse('1 samuel 1:2-3:4'))
+        with self.assertRaises(citations.ParsingError):
+            citations.parse('Is 49L1-6')
+        with self.assertRaises(citations.ParsingError):
+            citations.parse('Is 49L1-6')
+
     def test_singleTokenBookOnly(self):
         ref = citations.parse('gn')
         self.assertEqual('genesis', ref.book)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+'''
+Tests for :mod:`memotools`
+'''
+
+# Standard imports:
+import unittest
+
+# Local imports:
+import memotools
+
+class memoizeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+    def makeFunction(self, maxSize, keyOf=None):
+        @memotools.memoize(maxSize, keyOf)
+        def function(argument):
+            self.calls.append(argument)
+            if argument == 'bad':
+                raise ValueError(argument)
+            return [argument]
+        return function
+
+    def test_rememberedResult(self):
+        function = self.makeFunction(2)
+        self.assertIs(function('a'), function('a'))
+        self.assertEqual(['a'], self.calls)
+
+    def test_nonStringsNotRemembered(self):
+        function = self.makeFunction(2)
+        function(1)
+        function(1)
+        function(None)
+        self.assertEqual([1, 1, None], self.calls)
+
+    def test_exceptionsNotRemembered(self):
+        function = self.makeFunction(2)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                function('bad')
+        self.assertEqual(['bad', 'bad'], self.calls)
+
+    def test_startsAfreshWhenFull(self):
+        function = self.makeFunction(2)
+        function('a')
+        function('b')
+        function('c')
+        function('b')
+        function('c')
+        self.assertEqual(['a', 'b', 'c', 'b'], self.calls)
+
+    def test_keyOf(self):
+        function = self.makeFunction(2, keyOf=lambda argument: argument.lower())
+        self.assertIs(function('A'), function('a'))
+        self.assertEqual(['A'], self.calls)
+
+if __name__ == '__main__':
+    unittest.main()
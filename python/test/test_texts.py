@@ -36,9 +36,15 @@ class TextTestCase(unittest.TestCase):
 1:3 Carissimi...
 '''
 
+    @classmethod
+    def setUpClass(cls):
+        cls.textWithChapters = texts.Text('testing')
+        cls.textWithChapters.loadFromString(cls.bookWithChaptersText)
+        cls.textWithoutChapters = texts.Text('testing', False)
+        cls.textWithoutChapters.loadFromString(cls.bookWithoutChaptersText)
+
     def test_validateChapterKey(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         with self.assertRaises(KeyError):
             text._validateChapterKey(None)
@@ -52,8 +58,7 @@ class TextTestCase(unittest.TestCase):
         with self.assertRaises(KeyError):
             text._validateChapterKey(4)
 
-        text = texts.Text('testing', False)
-        text.loadFromString(self.bookWithoutChaptersText)
+        text = self.textWithoutChapters
 
         with self.assertRaises(KeyError):
             text._validateChapterKey(None)
@@ -70,8 +75,7 @@ class TextTestCase(unittest.TestCase):
             text._validateChapterKey(2)
 
     def test_validateChapterAndVerseKeys(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         with self.assertRaises(KeyError):
             text._validateChapterAndVerseKeys(None, 1)
@@ -97,8 +101,7 @@ class TextTestCase(unittest.TestCase):
         with self.assertRaises(KeyError):
             text._validateChapterAndVerseKeys(3, 4)
 
-        text = texts.Text('testing', False)
-        text.loadFromString(self.bookWithoutChaptersText)
+        text = self.textWithoutChapters
 
         with self.assertRaises(KeyError):
             text._validateChapterAndVerseKeys(None, 1)
@@ -119,8 +122,7 @@ class TextTestCase(unittest.TestCase):
             text._validateChapterAndVerseKeys(1, 4)
 
     def test_validateVerseKey(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # If the book has chapters, any verseKey by itself is cause
         # for an exception.
@@ -133,8 +135,7 @@ class TextTestCase(unittest.TestCase):
         with self.assertRaises(KeyError):
             text._validateVerseKey(1)
 
-        text = texts.Text('testing', False)
-        text.loadFromString(self.bookWithoutChaptersText)
+        text = self.textWithoutChapters
         with self.assertRaises(KeyError):
             text._validateVerseKey(None)
         with self.assertRaises(KeyError):
@@ -148,8 +149,7 @@ class TextTestCase(unittest.TestCase):
             text._validateVerseKey(4)
 
     def test_getVerse(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # This should return all of chapter 1.
         result = text.getVerse(addrs.Addr(1))
@@ -190,8 +190,7 @@ class TextTestCase(unittest.TestCase):
                 ((2, 3), u'Et benedixit diei septimo...'),
                 ])
 
-        text = texts.Text('testing', False)
-        text.loadFromString(self.bookWithoutChaptersText)
+        text = self.textWithoutChapters
 
         # This should return only verse 1.
         result = text.getVerse(addrs.Addr(1))
@@ -216,8 +215,7 @@ class TextTestCase(unittest.TestCase):
                 ])
 
     def test_getRangeOfVerses(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # Here are a few ranges entirely within the same chapter,
         # starting with 1:1-1:3.
@@ -322,8 +320,7 @@ class TextTestCase(unittest.TestCase):
         # must handle the case of a book with chapters.
 
     def test_allVersesInChapter(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # This should arrive at all verses in chapter 1.
         self.assertEqual(
@@ -341,8 +338,7 @@ class TextTestCase(unittest.TestCase):
                 ((2, 3), u'Et benedixit diei septimo...'),
                 ])
 
-        text = texts.Text('testing', False)
-        text.loadFromString(self.bookWithoutChaptersText)
+        text = self.textWithoutChapters
 
         # This should arrive at all verses in chapter 1.
         self.assertEqual(
@@ -352,9 +348,31 @@ class TextTestCase(unittest.TestCase):
                 ((1, 3), u'Carissimi...'),
                 ])
 
-    def test_lastVersesInChapter(self):
+    def test_loadFromString_unusualLines(self):
+        # A verse address with a letter takes the general route through
+        # addrs.parse, and blank lines are skipped.
         text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text.loadFromString(
+            u'1:1 In principio creavit Deus cælum et terram.\n'
+            u'\n'
+            u'1:2b Terra autem erat inanis et vacua...\n')
+        self.assertEqual(
+            text.getAllVerses(), [
+                ((1, 1), u'In principio creavit Deus cælum et terram.'),
+                ((1, 2), u'Terra autem erat inanis et vacua...'),
+                ])
+
+    def test_getAllVersesByChapter(self):
+        text = self.textWithChapters
+
+        chapters = text.getAllVersesByChapter()
+        self.assertEqual([1, 2, 3], [
+                chapterKey for chapterKey, verses in chapters])
+        for chapterKey, verses in chapters:
+            self.assertEqual(text._allVersesInChapter(chapterKey), verses)
+
+    def test_lastVersesInChapter(self):
+        text = self.textWithChapters
 
         # This should produce verses 1:1-3.
         self.assertEqual(
@@ -378,8 +396,7 @@ class TextTestCase(unittest.TestCase):
                 ])
 
     def test_firstVersesInChapter(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # This should produce verses 1:1-3.
         self.assertEqual(
@@ -403,8 +420,7 @@ class TextTestCase(unittest.TestCase):
                 ])
 
     def test_middleVersesInChapter(self):
-        text = texts.Text('testing')
-        text.loadFromString(self.bookWithChaptersText)
+        text = self.textWithChapters
 
         # This should produce all three verses of chapter one.
         self.assertEqual(
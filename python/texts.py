@@ -7,9 +7,9 @@ Reference
 '''
 
 # Standard imports:
+import bisect
 import collections
 import inspect
-import itertools
 import os
 import re
 import sys
@@ -22,6 +22,11 @@ _thisFilePath = inspect.getfile(inspect.currentframe())
 _projectFolderPath = os.path.dirname(os.path.dirname(_thisFilePath))
 _textFolderPath = os.path.join(_projectFolderPath, 'myclemtext')
 
+# Matches each non-empty line of a text: either a verse in the usual
+# form, ``chapter:verse text``, capturing all three parts, or else the
+# whole line (to be parsed by the general route).
+_lineOfTextRegex = re.compile(r'^(?:(\d+):(\d+) (.*)|(.+))$', re.MULTILINE)
+
 class Text(object):
     '''
     A Text divided into verses (and probably chapters too).
@@ -31,6 +36,7 @@ class Text(object):
         self.normalName = normalName
         self.hasChapters = hasChapters
         self._text = collections.OrderedDict()
+        self._chapterIndexes = {}
 
     @property
     def chapterKeys(self):
@@ -49,17 +55,24 @@ class Text(object):
         textFileName = '%s.txt' % self.normalName
         textFilePath = os.path.join(_textFolderPath, textFileName)
         with open(textFilePath, 'r') as inputFile:
-            for line in inputFile.readlines():
-                self._loadLineOfText(line)
+            self.loadFromString(inputFile.read())
 
     def loadFromString(self, text):
         '''
         Load the text of this book from a string.  (To support unit
         testing.)
+
+        The whole string is scanned in a single pass.  Only lines not
+        in the usual ``chapter:verse text`` form take the slower route
+        through :func:`addrs.parse`.
         '''
 
-        for line in text.splitlines():
-            self._loadLineOfText(line)
+        for matchResult in _lineOfTextRegex.finditer(text):
+            chapterToken, verseToken, verseText, line = matchResult.groups()
+            if line is None:
+                self._loadVerse(int(chapterToken), int(verseToken), verseText)
+            else:
+                self._loadLineOfText(line)
 
     def _loadLineOfText(self, line):
         '''
@@ -70,10 +83,17 @@ class Text(object):
         verseAddrToken, verseText = line.split(' ', 1)
         verseAddrList = addrs.parse(verseAddrToken)
         verseAddr = verseAddrList[0]
-        chapterKey, verseKey = verseAddr.first, verseAddr.second
+        self._loadVerse(verseAddr.first, verseAddr.second, verseText)
+
+    def _loadVerse(self, chapterKey, verseKey, verseText):
+        '''
+        Add a single verse to the text.
+        '''
+
         if chapterKey not in self._text:
             self._text[chapterKey] = collections.OrderedDict()
         self._text[chapterKey][verseKey] = verseText.strip()
+        self._chapterIndexes.pop(chapterKey, None)
 
     def _validateChapterKey(self, chapterKey):
         '''
@@ -193,99 +213,106 @@ class Text(object):
                 return self._middleVersesInChapter(
                     firstChapterKey, firstVerseKey, lastVerseKey)
 
-        # Add the verses from the first chapter in the range.
+        # Add the verses from the first chapter in the range.  (Whole
+        # chapters are extended straight from the chapter index, with
+        # no intermediate copy.)
+        indexChapter = self._indexChapter
         result = []
         if firstVerseKey is None:
-            result.extend(self._allVersesInChapter(firstChapterKey))
+            result.extend(indexChapter(firstChapterKey)[1])
         else:
             result.extend(
                 self._lastVersesInChapter(firstChapterKey, firstVerseKey))
 
         # Add all the verses from any interior chapters.
-        for chapter in range(firstChapterKey + 1, lastChapterKey):
-            result.extend(
-                self._allVersesInChapter(
-                    chapter))
+        for chapter in xrange(firstChapterKey + 1, lastChapterKey):
+            result.extend(indexChapter(chapter)[1])
 
         # Add the verses from the last chapter in the range.
         if lastVerseKey is None:
-            result.extend(self._allVersesInChapter(lastChapterKey))
+            result.extend(indexChapter(lastChapterKey)[1])
         else:
             result.extend(
                 self._firstVersesInChapter(lastChapterKey, lastVerseKey))
 
         return result
 
-    def _visitAllVersesInChapter(self, chapterKey):
+    def _indexChapter(self, chapterKey):
         '''
-        Return a visitor onto every verse object associated with
-        `chapterKey`.
+        Return a pair of lists for the chapter having `chapterKey`: its
+        verse keys, and its verse objects, both in order.
+
+        The pair is built on first use and kept until the chapter
+        changes.  Ranges of verses then come from slicing the list of
+        verse objects at positions found by bisecting the list of verse
+        keys (which ascend, as in the text of Scripture).
         '''
 
-        return (
+        try:
+            return self._chapterIndexes[chapterKey]
+        except KeyError:
+            pass
+
+        verses = [
             ((chapterKey, verseKey), verseText)
             for verseKey, verseText in self._text[chapterKey].iteritems()
-            )
+            ]
+        verseKeys = [verseKey for (_, verseKey), _ in verses]
+        chapterIndex = self._chapterIndexes[chapterKey] = (verseKeys, verses)
+        return chapterIndex
+
+    def _visitAllVersesInChapter(self, chapterKey):
+        '''
+        Return a list of every verse object associated with `chapterKey`.
+        '''
+
+        return self._indexChapter(chapterKey)[1][:]
 
     def _allVersesInChapter(self, chapterKey):
-        return list(self._visitAllVersesInChapter(chapterKey))
+        return self._visitAllVersesInChapter(chapterKey)
 
     def _visitLastVersesInChapter(self, chapterKey, firstVerseKey):
         '''
-        Return a visitor onto every verse object associated with
-        `chapterKey` starting with `firstVerseKey`.
+        Return a list of every verse object associated with `chapterKey`
+        starting with `firstVerseKey`.
         '''
 
-        def isExcluded(item):
-            verseAddr, verseText = item
-            chapterKey, verseKey = verseAddr
-            return verseKey < firstVerseKey
-
-        return itertools.dropwhile(
-            isExcluded, self._visitAllVersesInChapter(chapterKey))
+        verseKeys, verses = self._indexChapter(chapterKey)
+        return verses[bisect.bisect_left(verseKeys, firstVerseKey):]
 
     def _lastVersesInChapter(self, chapterKey, firstVerseKey):
-        return list(self._visitLastVersesInChapter(chapterKey, firstVerseKey))
+        return self._visitLastVersesInChapter(chapterKey, firstVerseKey)
 
     def _visitFirstVersesInChapter(self, chapterKey, lastVerseKey):
         '''
-        Return a visitor onto every verse object associated with
-        `chapterKey` up to an including `lastVerseKey`.
+        Return a list of every verse object associated with `chapterKey`
+        up to an including `lastVerseKey`.
         '''
 
-        def isIncluded(item):
-            verseAddr, verseText = item
-            chapterKey, verseKey = verseAddr
-            return verseKey <= lastVerseKey
-
-        return itertools.takewhile(
-            isIncluded, self._visitAllVersesInChapter(chapterKey))
+        verseKeys, verses = self._indexChapter(chapterKey)
+        return verses[:bisect.bisect_right(verseKeys, lastVerseKey)]
 
     def _firstVersesInChapter(self, chapterKey, lastVerseKey):
-        return list(self._visitFirstVersesInChapter(chapterKey, lastVerseKey))
+        return self._visitFirstVersesInChapter(chapterKey, lastVerseKey)
 
     def _visitMiddleVersesInChapter(self,
                                     chapterKey,
                                     firstVerseKey,
                                     lastVerseKey):
         '''
-        Return a visitor onto the inclusive range of verses,
+        Return a list of the inclusive range of verses,
         [`firstVerseKey`, `lastVerseKey`] in the chapter having
         `chapterKey`.
         '''
 
-        def isIncluded(item):
-            verseAddr, verseText = item
-            chapterKey, verseKey = verseAddr
-            return (verseKey >= firstVerseKey) and (verseKey <= lastVerseKey)
-
-        return itertools.ifilter(
-            isIncluded, self._visitAllVersesInChapter(chapterKey))
+        verseKeys, verses = self._indexChapter(chapterKey)
+        return verses[
+            bisect.bisect_left(verseKeys, firstVerseKey):
+            bisect.bisect_right(verseKeys, lastVerseKey)]
 
     def _middleVersesInChapter(self, chapterKey, firstVerseKey, lastVerseKey):
-        return list(
-            self._visitMiddleVersesInChapter(
-                chapterKey, firstVerseKey, lastVerseKey))
+        return self._visitMiddleVersesInChapter(
+            chapterKey, firstVerseKey, lastVerseKey)
 
     def getAllVerses(self):
         '''
@@ -298,6 +325,22 @@ class Text(object):
                 verses.append(((chapterKey, verseKey), verseText))
         return verses
 
+    def getAllVersesByChapter(self):
+        '''
+        Return an object representation of every verse in the book,
+        grouped by chapter: a ``list`` of pairs of a chapter key and
+        the verses of that chapter (as :meth:`getAllVerses` would
+        represent them).
+        '''
+
+        return [
+            (chapterKey, [
+                    ((chapterKey, verseKey), verseText)
+                    for verseKey, verseText in chapterVerses.iteritems()
+                    ])
+            for chapterKey, chapterVerses in self._text.iteritems()
+            ]
+
     def getAllWords(self):
         '''
         Return each word (no punctuation, no formatting) in lowercase